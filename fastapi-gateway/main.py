@@ -3,44 +3,160 @@ Stock Hunter FastAPI Gateway
 
 클라이언트와 Kotlin 스크리닝 엔진 사이의 게이트웨이 역할
 """
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Header, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse, FileResponse
+from fastapi.responses import ORJSONResponse, HTMLResponse, FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
-import httpx
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Callable, List, Optional, Dict, Any
+from contextlib import asynccontextmanager
+import asyncio
+import aiohttp
+import atexit
+import hashlib
 import logging
 import os
+import queue
+import random
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener
+
+# 로깅 설정 (실제 출력은 별도 스레드에서 처리해 이벤트 루프가 로그 I/O로 막히지 않도록 함)
+log_queue = queue.SimpleQueue()
+log_output = logging.StreamHandler()
+log_output.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = QueueListener(log_queue, log_output)
+log_listener.start()
+atexit.register(log_listener.stop)
 
-# 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(message)s',  # 최종 포맷은 log_output에서 적용
+    handlers=[QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+
+# 웹 UI 응답 헤더 (브라우저 캐시 허용)
+INDEX_HTML_HEADERS = {"Cache-Control": "public, max-age=300"}
+
+
+def load_index_html() -> HTMLResponse:
+    """웹 UI HTML을 한 번 읽어 응답 객체로 만든다 (앱 시작 시 1회 호출)"""
+    # HTML 파일 경로 (로컬 개발: 부모 디렉토리, Docker: 같은 디렉토리)
+    html_paths = [
+        Path(__file__).parent / "stock_screener.html",  # Docker
+        Path(__file__).parent.parent / "stock_screener.html",  # 로컬 개발
+    ]
+    
+    for html_path in html_paths:
+        if html_path.exists():
+            try:
+                with open(html_path, "r", encoding="utf-8", errors="replace") as f:
+                    html_content = f.read()
+                
+                logger.info("Loaded HTML from: %s", html_path)
+                return HTMLResponse(content=html_content, headers=INDEX_HTML_HEADERS)
+            except Exception as e:
+                logger.error("Failed to read HTML file: %s", e)
+                # Try with latin-1 encoding as fallback
+                try:
+                    with open(html_path, "r", encoding="latin-1") as f:
+                        html_content = f.read()
+                    logger.info("Loaded HTML from: %s (using latin-1 encoding)", html_path)
+                    return HTMLResponse(content=html_content, headers=INDEX_HTML_HEADERS)
+                except Exception as e2:
+                    logger.error("Failed with fallback encoding: %s", e2)
+                    continue
+    
+    return HTMLResponse(
+        content="""
+        <html>
+            <head><title>Stock Hunter</title></head>
+            <body style="font-family: sans-serif; padding: 50px; text-align: center;">
+                <h1>🚨 Stock Hunter API</h1>
+                <p>HTML 파일을 찾을 수 없습니다.</p>
+                <p>stock_screener.html 파일이 올바른 위치에 있는지 확인하세요.</p>
+                <hr>
+                <p><a href="/health">Health Check</a> | <a href="/docs">API Docs</a></p>
+            </body>
+        </html>
+        """
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명 주기 동안 공유 리소스 관리 (Kotlin 서버용 HTTP 커넥션 풀, 웹 UI HTML)"""
+    # 리눅스/macOS에서는 uvloop로 실행되어야 함 (uvicorn[standard]가 설치되어 있으면 자동 선택)
+    loop_module = type(asyncio.get_running_loop()).__module__
+    if sys.platform != "win32" and not loop_module.startswith("uvloop"):
+        logger.warning("Event loop is %s, not uvloop - check that uvloop is installed", loop_module)
+    app.state.http = aiohttp.ClientSession(
+        base_url=KOTLIN_SERVICE_URL,
+        timeout=aiohttp.ClientTimeout(total=300.0, connect=BACKEND_CONNECT_TIMEOUT),
+        connector=aiohttp.TCPConnector(
+            limit=200,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+    )
+    # 파일 읽기는 블로킹 I/O이므로 스레드에서 실행
+    app.state.index_html = await asyncio.to_thread(load_index_html)
+    app.state.stock_codes = None
+    app.state.stock_codes_lock = asyncio.Lock()
+    app.state.screen_cache = {}
+    app.state.screen_in_flight = {}
+    app.state.screen_semaphore = asyncio.Semaphore(SCREEN_MAX_CONCURRENCY)
+    # 첫 사용자가 기다리지 않도록 종목 코드를 미리 받아둠 (시작은 막지 않음)
+    prefetch = asyncio.create_task(prefetch_stock_codes())
+    try:
+        yield
+    finally:
+        prefetch.cancel()
+        await app.state.http.close()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="Stock Hunter API Gateway",
     description="주식 스크리닝 서비스 API Gateway",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# CORS 설정
+# CORS 설정 (웹 UI는 게이트웨이가 직접 제공하므로 허용 도메인만 명시)
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # 프로덕션에서는 특정 도메인만 허용
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,  # preflight 결과를 브라우저가 하루 동안 캐시
 )
 
 # Kotlin 서버 URL (Docker 환경에서는 서비스명 사용)
 KOTLIN_SERVICE_URL = os.getenv("KOTLIN_SERVICE_URL", "http://kotlin-screener:8080")
 
+# Kotlin 서버 연결 타임아웃(초)
+# 요청별 ClientTimeout은 세션 설정과 합쳐지지 않고 통째로 대체하므로 호출마다 함께 지정
+BACKEND_CONNECT_TIMEOUT = 5.0
+
+# Kotlin 서버로 동시에 보낼 스크리닝 요청 수 (워커당), 빈 자리를 기다리는 최대 시간(초)
+SCREEN_MAX_CONCURRENCY = int(os.getenv("SCREEN_MAX_CONCURRENCY", "16"))
+SCREEN_QUEUE_TIMEOUT = float(os.getenv("SCREEN_QUEUE_TIMEOUT", "10"))
+
 # ==================== Models ====================
 
 class ScreeningRequest(BaseModel):
@@ -107,51 +223,196 @@ class CredentialsRequest(BaseModel):
     appSecret: str
 
 
+# /screen 요청 본문을 raw bytes에서 바로 검증 (json.loads + dict 검증 단계 생략)
+screening_adapter = TypeAdapter(ScreeningRequest)
+
+
+# ==================== Backend Client ====================
+
+# 일시적인 Kotlin 연결 오류(재시작, GC 멈춤 등)는 지수 백오프 + 지터로 재시도
+BACKEND_RETRY_ATTEMPTS = 3
+BACKEND_RETRY_INITIAL_DELAY = 0.1
+BACKEND_RETRY_MAX_DELAY = 2.0
+BACKEND_RETRY_AFTER_MAX = 5.0
+
+# 연결 오류: ClientConnectorError는 요청이 전송되기 전에 실패한 경우,
+# ServerDisconnectedError는 요청을 보낸 뒤 Kotlin이 연결을 끊은 경우(처리 도중 종료 포함)라
+# 이미 처리됐을 수도 있지만, 세 API 모두 조회/검증이라 다시 보내도 안전함
+RETRYABLE_ERRORS = (aiohttp.ClientConnectorError, aiohttp.ServerDisconnectedError)
+# 조회/검증처럼 다시 보내도 안전한 요청은 타임아웃도 재시도
+IDEMPOTENT_RETRYABLE_ERRORS = RETRYABLE_ERRORS + (asyncio.TimeoutError,)
+
+
+async def backend_request(
+    method: str,
+    url: str,
+    retry_on: tuple = RETRYABLE_ERRORS,
+    **kwargs
+) -> aiohttp.ClientResponse:
+    """
+    Kotlin 서버 호출 (공유 세션 사용, 일시적 오류 재시도)
+    
+    503 응답에 Retry-After(초)가 있으면 그만큼 기다렸다가 재시도합니다.
+    반환된 응답은 호출한 쪽에서 release 해야 합니다.
+    """
+    client: aiohttp.ClientSession = app.state.http
+    
+    for attempt in range(1, BACKEND_RETRY_ATTEMPTS + 1):
+        is_last = attempt == BACKEND_RETRY_ATTEMPTS
+        try:
+            response = await client.request(method, url, **kwargs)
+        except retry_on as e:
+            if is_last:
+                raise
+            delay = min(
+                BACKEND_RETRY_MAX_DELAY,
+                BACKEND_RETRY_INITIAL_DELAY * 2 ** (attempt - 1)
+                + random.uniform(0, BACKEND_RETRY_INITIAL_DELAY)
+            )
+            logger.warning("Kotlin request %s %s failed (%s), retrying in %.2fs", method, url, e, delay)
+        else:
+            retry_after = response.headers.get("Retry-After", "")
+            if response.status != 503 or not retry_after.isdigit() or is_last:
+                return response
+            response.release()
+            delay = min(float(retry_after), BACKEND_RETRY_AFTER_MAX)
+            logger.warning("Kotlin service busy, retrying %s %s in %.2fs", method, url, delay)
+        
+        await asyncio.sleep(delay)
+
+
+# ==================== Stock Codes Cache ====================
+
+# 종목 코드 목록은 하루에 한 번 정도만 바뀌므로 워커별 메모리에 캐시
+STOCK_CODES_TTL = 3600
+
+
+async def get_cached_stock_codes() -> Dict[str, Any]:
+    """종목 코드 응답(JSON bytes + ETag)을 TTL 동안 캐시해서 반환"""
+    cached = app.state.stock_codes
+    if cached and cached["expires_at"] > time.monotonic():
+        return cached
+    
+    async with app.state.stock_codes_lock:
+        # 락을 기다리는 동안 다른 요청이 이미 갱신했을 수 있음
+        cached = app.state.stock_codes
+        if cached and cached["expires_at"] > time.monotonic():
+            return cached
+        
+        response = await backend_request(
+            "GET",
+            "/api/v1/stock-codes",
+            retry_on=IDEMPOTENT_RETRYABLE_ERRORS,
+            timeout=aiohttp.ClientTimeout(total=5.0, connect=BACKEND_CONNECT_TIMEOUT)
+        )
+        async with response:
+            if response.status != 200:
+                raise HTTPException(
+                    status_code=response.status,
+                    detail="종목 코드 조회 실패"
+                )
+            
+            content = await response.read()
+        
+        cached = {
+            "content": content,
+            "etag": f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"',
+            "expires_at": time.monotonic() + STOCK_CODES_TTL
+        }
+        app.state.stock_codes = cached
+        return cached
+
+
+async def prefetch_stock_codes():
+    """앱 시작 시 종목 코드 캐시를 미리 채움"""
+    try:
+        await get_cached_stock_codes()
+        logger.info("Stock codes prefetched")
+    except Exception as e:
+        logger.warning("Stock codes prefetch failed: %s", e)
+
+
+# ==================== Screening Cache ====================
+
+# 같은 사용자의 같은 조건 스크리닝(재클릭, 여러 탭)은 잠시 동안 캐시된 결과로 응답
+SCREEN_CACHE_TTL = 60
+SCREEN_CACHE_MAX_ENTRIES = 128
+
+# Kotlin 스크리닝 요청 타임아웃(초)
+SCREEN_TIMEOUT = 300.0
+
+
+def screening_cache_key(request: ScreeningRequest) -> str:
+    """
+    스크리닝 조건 + API 키 digest로 캐시 키 생성
+    
+    인증 정보가 다른 요청은 서로의 결과를 받지 않도록 키/시크릿의 해시를 포함합니다.
+    (원문 키/시크릿은 캐시 키나 로그에 남지 않음)
+    """
+    credentials = hashlib.blake2b(
+        f"{request.appKey}\0{request.appSecret}".encode(),
+        digest_size=16
+    ).digest()
+    payload = request.model_dump_json(exclude={"appKey", "appSecret"}).encode()
+    return hashlib.blake2b(credentials + payload, digest_size=16).hexdigest()
+
+
+def get_cached_screening(key: str) -> Optional[Dict[str, Any]]:
+    """만료되지 않은 스크리닝 결과 반환"""
+    cached = app.state.screen_cache.get(key)
+    if cached and cached["expires_at"] > time.monotonic():
+        return cached
+    return None
+
+
+def store_screening(key: str, content: bytes, media_type: str) -> Dict[str, Any]:
+    """스크리닝 결과 저장 (가장 오래된 항목부터 밀어냄)"""
+    cache: Dict[str, Dict[str, Any]] = app.state.screen_cache
+    cache.pop(key, None)
+    while len(cache) >= SCREEN_CACHE_MAX_ENTRIES:
+        cache.pop(next(iter(cache)))
+    cached = {
+        "content": content,
+        "media_type": media_type,
+        "expires_at": time.monotonic() + SCREEN_CACHE_TTL
+    }
+    cache[key] = cached
+    return cached
+
+
+def finish_in_flight_screening(key: str, flight: asyncio.Future, result: Any):
+    """
+    진행 중인 스크리닝 종료: 기다리던 요청에 결과를 넘기고 등록 해제
+    
+    result는 캐시 항목(성공), 예외(Kotlin 오류 등, 기다리던 요청도 같은 오류로 응답),
+    None(클라이언트 연결 끊김 등, 기다리던 요청 중 하나가 다시 처리) 중 하나입니다.
+    """
+    if not flight.done():
+        flight.set_result(result)
+    if app.state.screen_in_flight.get(key) is flight:
+        del app.state.screen_in_flight[key]
+
+
+class RelayResponse(StreamingResponse):
+    """전송이 시작되지 못하고 끝나도 on_close가 반드시 호출되는 StreamingResponse"""
+    
+    def __init__(self, *args, on_close: Callable[[], None], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_close = on_close
+    
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.on_close()
+
+
 # ==================== Routes ====================
 
 @app.get("/", response_class=HTMLResponse)
 async def root():
-    """웹 UI 제공"""
-    # HTML 파일 경로 (로컬 개발: 부모 디렉토리, Docker: 같은 디렉토리)
-    html_paths = [
-        Path(__file__).parent / "stock_screener.html",  # Docker
-        Path(__file__).parent.parent / "stock_screener.html",  # 로컬 개발
-    ]
-    
-    for html_path in html_paths:
-        if html_path.exists():
-            try:
-                with open(html_path, "r", encoding="utf-8", errors="replace") as f:
-                    html_content = f.read()
-                
-                logger.info(f"Serving HTML from: {html_path}")
-                return HTMLResponse(content=html_content)
-            except Exception as e:
-                logger.error(f"Failed to read HTML file: {e}")
-                # Try with latin-1 encoding as fallback
-                try:
-                    with open(html_path, "r", encoding="latin-1") as f:
-                        html_content = f.read()
-                    logger.info(f"Serving HTML from: {html_path} (using latin-1 encoding)")
-                    return HTMLResponse(content=html_content)
-                except Exception as e2:
-                    logger.error(f"Failed with fallback encoding: {e2}")
-                    continue
-    
-    return HTMLResponse(
-        content="""
-        <html>
-            <head><title>Stock Hunter</title></head>
-            <body style="font-family: sans-serif; padding: 50px; text-align: center;">
-                <h1>🚨 Stock Hunter API</h1>
-                <p>HTML 파일을 찾을 수 없습니다.</p>
-                <p>stock_screener.html 파일이 올바른 위치에 있는지 확인하세요.</p>
-                <hr>
-                <p><a href="/health">Health Check</a> | <a href="/docs">API Docs</a></p>
-            </body>
-        </html>
-        """
-    )
+    """웹 UI 제공 (시작 시 메모리에 올려둔 페이지 반환)"""
+    return app.state.index_html
 
 
 @app.get("/api")
@@ -170,11 +431,14 @@ async def health_check():
     """헬스 체크"""
     try:
         # Kotlin 서버 상태 확인
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{KOTLIN_SERVICE_URL}/health")
-            kotlin_healthy = response.status_code == 200
+        client: aiohttp.ClientSession = app.state.http
+        async with client.get(
+            "/health",
+            timeout=aiohttp.ClientTimeout(total=5.0, connect=BACKEND_CONNECT_TIMEOUT)
+        ) as response:
+            kotlin_healthy = response.status == 200
     except Exception as e:
-        logger.warning(f"Kotlin service health check failed: {e}")
+        logger.warning("Kotlin service health check failed: %s", e)
         kotlin_healthy = False
     
     return {
@@ -187,45 +451,130 @@ async def health_check():
     }
 
 
-@app.post("/api/v1/screen")
-async def screen_stocks(request: ScreeningRequest):
+@app.post(
+    "/api/v1/screen",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ScreeningRequest.model_json_schema()}}
+        }
+    }
+)
+async def screen_stocks(http_request: Request):
     """
     주식 스크리닝 실행
     
     Kotlin 스크리닝 엔진으로 요청을 전달하고 결과를 반환합니다.
     """
     try:
-        logger.info(f"Received screening request - MA112: {request.ma112Enabled}, BB: {request.bbEnabled}")
+        request = screening_adapter.validate_json(await http_request.body())
+    except ValidationError as e:
+        # FastAPI 기본 검증 오류와 같은 형식(422, loc에 "body" 포함)으로 응답
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ])
+    
+    try:
+        logger.info("Received screening request - MA112: %s, BB: %s", request.ma112Enabled, request.bbEnabled)
         
-        # Kotlin 서버로 요청 전달
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.post(
-                f"{KOTLIN_SERVICE_URL}/api/v1/screen",
-                json=request.model_dump(),
-                headers={"Content-Type": "application/json"}
-            )
-            
-            if response.status_code != 200:
-                error_detail = response.json() if response.text else {"error": "Unknown error"}
-                logger.error(f"Kotlin service error: {error_detail}")
+        cache_key = screening_cache_key(request)
+        cached = get_cached_screening(cache_key)
+        if cached:
+            logger.info("Screening served from cache")
+            return Response(content=cached["content"], media_type=cached["media_type"])
+        
+        # 같은 조건의 요청이 이미 Kotlin에서 처리 중이면 그 결과를 함께 사용 (single-flight)
+        # 진행 중인 요청이 결과 없이 끝나면 먼저 깨어난 요청 하나만 새로 처리하고 나머지는 다시 그 결과를 기다림
+        # (처리 중인 요청은 오류 처리 또는 RelayResponse.on_close에서 반드시 future를 완료하므로 대기 제한 없음)
+        in_flight: Dict[str, asyncio.Future] = app.state.screen_in_flight
+        while (pending := in_flight.get(cache_key)) is not None:
+            shared = await asyncio.shield(pending)
+            if isinstance(shared, Exception):
+                raise shared
+            if shared:
+                logger.info("Screening shared with in-flight request")
+                return Response(content=shared["content"], media_type=shared["media_type"])
+        
+        flight = asyncio.get_running_loop().create_future()
+        in_flight[cache_key] = flight
+        
+        try:
+            # Kotlin 서버 과부하 방지: 동시 요청 수를 제한하고, 오래 밀리면 바로 실패 처리
+            semaphore: asyncio.Semaphore = app.state.screen_semaphore
+            try:
+                await asyncio.wait_for(semaphore.acquire(), timeout=SCREEN_QUEUE_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("Screening queue is full")
                 raise HTTPException(
-                    status_code=response.status_code,
-                    detail=error_detail
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="스크리닝 요청이 많습니다. 잠시 후 다시 시도해주세요."
                 )
             
-            result = response.json()
-            logger.info(f"Screening completed: {result.get('matchedCount', 0)} matches")
+            # Kotlin 서버로 요청 전달 (연결 오류만 재시도, 타임아웃은 재시도하지 않음)
+            try:
+                response = await backend_request(
+                    "POST",
+                    "/api/v1/screen",
+                    data=request.model_dump_json().encode(),
+                    headers={"Content-Type": "application/json"},
+                    timeout=aiohttp.ClientTimeout(total=SCREEN_TIMEOUT, connect=BACKEND_CONNECT_TIMEOUT)
+                )
+            finally:
+                semaphore.release()
             
-            return result
+            if response.status != 200:
+                try:
+                    error_detail = await response.json(content_type=None) or {"error": "Unknown error"}
+                finally:
+                    response.release()
+                logger.error("Kotlin service error: %s", error_detail)
+                raise HTTPException(
+                    status_code=response.status,
+                    detail=error_detail
+                )
+        except Exception as e:
+            # Kotlin 오류/연결 실패는 기다리던 요청에도 그대로 전달 (같은 호출을 반복하지 않음)
+            finish_in_flight_screening(cache_key, flight, e)
+            raise
+        except BaseException:
+            # 요청 취소(클라이언트 연결 끊김 등)는 기다리던 요청 중 하나가 이어서 처리
+            finish_in_flight_screening(cache_key, flight, None)
+            raise
+        
+        media_type = response.headers.get("Content-Type", "application/json")
+        
+        relayed: Dict[str, Any] = {}
+        
+        async def relay():
+            # Kotlin 응답을 파싱/재직렬화하지 않고 받은 그대로 클라이언트에 흘려보냄
+            chunks = []
+            async for chunk in response.content.iter_any():
+                chunks.append(chunk)
+                yield chunk
+            # 끝까지 전달된 응답만 캐시/공유
+            relayed["result"] = store_screening(cache_key, b"".join(chunks), media_type)
+            logger.info("Screening completed")
+        
+        def close():
+            response.release()
+            finish_in_flight_screening(cache_key, flight, relayed.get("result"))
+        
+        return RelayResponse(
+            relay(),
+            status_code=response.status,
+            media_type=media_type,
+            on_close=close
+        )
             
-    except httpx.TimeoutException:
+    except asyncio.TimeoutError:
         logger.error("Request to Kotlin service timed out")
         raise HTTPException(
             status_code=status.HTTP_504_GATEWAY_TIMEOUT,
             detail="스크리닝 요청 시간 초과. 잠시 후 다시 시도해주세요."
         )
-    except httpx.ConnectError:
-        logger.error("Cannot connect to Kotlin service")
+    except (aiohttp.ClientConnectorError, aiohttp.ServerDisconnectedError) as e:
+        logger.error("Cannot connect to Kotlin service: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="스크리닝 서비스에 연결할 수 없습니다."
@@ -233,7 +582,7 @@ async def screen_stocks(request: ScreeningRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error during screening: {e}", exc_info=True)
+        logger.error("Unexpected error during screening: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"스크리닝 중 오류 발생: {str(e)}"
@@ -248,26 +597,26 @@ async def validate_credentials(request: CredentialsRequest):
     try:
         logger.info("Validating API credentials")
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{KOTLIN_SERVICE_URL}/api/v1/validate-credentials",
-                json={
-                    "appKey": request.appKey,
-                    "appSecret": request.appSecret
-                }
-            )
-            
-            result = response.json()
-            
-            if response.status_code == 200:
-                logger.info("Credentials validated successfully")
-                return {"valid": True, "message": "인증 성공"}
-            else:
-                logger.warning("Invalid credentials")
-                return {"valid": False, "message": result.get("message", "인증 실패")}
+        response = await backend_request(
+            "POST",
+            "/api/v1/validate-credentials",
+            retry_on=IDEMPOTENT_RETRYABLE_ERRORS,
+            data=request.model_dump_json().encode(),
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=10.0, connect=BACKEND_CONNECT_TIMEOUT)
+        )
+        async with response:
+            result = await response.json(content_type=None)
+        
+        if response.status == 200:
+            logger.info("Credentials validated successfully")
+            return {"valid": True, "message": "인증 성공"}
+        else:
+            logger.warning("Invalid credentials")
+            return {"valid": False, "message": result.get("message", "인증 실패")}
                 
     except Exception as e:
-        logger.error(f"Credential validation error: {e}")
+        logger.error("Credential validation error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"인증 검증 중 오류 발생: {str(e)}"
@@ -275,24 +624,30 @@ async def validate_credentials(request: CredentialsRequest):
 
 
 @app.get("/api/v1/stock-codes")
-async def get_stock_codes():
+async def get_stock_codes(if_none_match: Optional[str] = Header(None)):
     """
     지원하는 종목 코드 목록 조회
+    
+    게이트웨이 캐시(TTL 1시간)에서 응답하며, ETag로 브라우저 재검증을 지원합니다.
     """
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{KOTLIN_SERVICE_URL}/api/v1/stock-codes")
-            
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail="종목 코드 조회 실패"
-                )
-            
-            return response.json()
+        cached = await get_cached_stock_codes()
+        headers = {
+            "ETag": cached["etag"],
+            "Cache-Control": f"public, max-age={STOCK_CODES_TTL}"
+        }
+        
+        if if_none_match == cached["etag"]:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+        return Response(
+            content=cached["content"],
+            media_type="application/json",
+            headers=headers
+        )
             
     except Exception as e:
-        logger.error(f"Error fetching stock codes: {e}")
+        logger.error("Error fetching stock codes: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"종목 코드 조회 중 오류 발생: {str(e)}"
@@ -304,7 +659,7 @@ async def get_stock_codes():
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc: HTTPException):
     """HTTP 예외 처리"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
@@ -316,8 +671,8 @@ async def http_exception_handler(request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc: Exception):
     """일반 예외 처리"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Internal server error",
@@ -330,11 +685,19 @@ async def general_exception_handler(request, exc: Exception):
 if __name__ == "__main__":
     import uvicorn
     
+    # 개발 모드(RELOAD=true)에서만 자동 리로드, 그 외에는 멀티 워커로 실행
+    # (HTTP 세션/캐시는 lifespan에서 워커마다 따로 생성됨)
+    reload = os.getenv("RELOAD", "true").lower() == "true"
+    workers = int(os.getenv("WEB_CONCURRENCY") or os.cpu_count() or 1)
+    
     logger.info("🚀 Starting FastAPI Gateway Server...")
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=3000,
-        reload=True,
+        loop="auto",  # uvloop/httptools가 설치되어 있으면 사용 (Windows는 기본 asyncio)
+        http="auto",
+        reload=reload,
+        workers=None if reload else workers,
         log_level="info"
     )
@@ -15,6 +15,9 @@ IS_PRODUCTION = False  # False: 모의투자, True: 실전투자
 # 테스트할 종목코드
 STOCK_CODE = "005930"  # 삼성전자
 
+# 토큰 발급/시세 조회가 같은 커넥션(Keep-Alive)을 재사용하도록 세션 공유
+session = requests.Session()
+
 def get_access_token():
     """접근 토큰 발급"""
     url = "https://openapi.koreainvestment.com:9443/oauth2/tokenP"
@@ -30,7 +33,7 @@ def get_access_token():
     }
     
     print(f"🔑 토큰 발급 요청...")
-    response = requests.post(url, headers=headers, json=data)
+    response = session.post(url, headers=headers, json=data)
     
     if response.status_code == 200:
         result = response.json()
@@ -68,7 +71,7 @@ def get_current_price(access_token, stock_code):
     print(f"  - URL: {url}")
     print(f"  - Params: {params}")
     
-    response = requests.get(url, headers=headers, params=params)
+    response = session.get(url, headers=headers, params=params)
     
     print(f"\n📥 응답 상태: {response.status_code}")
     
@@ -4,6 +4,7 @@
 import os
 import json
 import requests
+from dotenv import dotenv_values
 from datetime import datetime, timedelta
 
 # .env.test 파일 로드
@@ -12,22 +13,20 @@ if not os.path.exists(env_path):
     print("❌ .env.test 파일이 없습니다!")
     exit(1)
 
-config = {}
-with open(env_path) as f:
-    for line in f:
-        line = line.strip()
-        if line and not line.startswith('#') and '=' in line:
-            key, value = line.split('=', 1)
-            config[key] = value
+# 따옴표, export 접두사, 인라인 주석까지 처리
+config = dotenv_values(env_path)
 
-APP_KEY = config.get('KIS_APP_KEY', '')
-APP_SECRET = config.get('KIS_APP_SECRET', '')
-IS_PRODUCTION = config.get('KIS_IS_PRODUCTION', 'true') == 'true'
+APP_KEY = config.get('KIS_APP_KEY') or ''
+APP_SECRET = config.get('KIS_APP_SECRET') or ''
+IS_PRODUCTION = (config.get('KIS_IS_PRODUCTION') or 'true') == 'true'
 
 if not APP_KEY or APP_KEY == '여기에_앱키_붙여넣기':
     print("❌ KIS_APP_KEY가 설정되지 않았습니다!")
     exit(1)
 
+# 토큰 발급/시세 조회가 같은 커넥션(Keep-Alive)을 재사용하도록 세션 공유
+session = requests.Session()
+
 print("🔍 한국투자증권 API 테스트")
 print("=" * 60)
 print(f"환경: {'실전투자' if IS_PRODUCTION else '모의투자'}")
@@ -44,7 +43,7 @@ token_data = {
 }
 
 try:
-    resp = requests.post(token_url, json=token_data)
+    resp = session.post(token_url, json=token_data)
     token_result = resp.json()
     
     if 'access_token' in token_result:
@@ -91,7 +90,7 @@ print(f"기간: {params['FID_INPUT_DATE_1']} ~ {params['FID_INPUT_DATE_2']}")
 print()
 
 try:
-    resp = requests.get(base_url + endpoint, headers=headers, params=params)
+    resp = session.get(base_url + endpoint, headers=headers, params=params)
     result = resp.json()
     
     print(f"응답 코드: {result.get('rt_cd')}")